@@ -16,7 +16,6 @@ Resources
 
 import json
 from collections import OrderedDict
-from copy import deepcopy
 
 
 class TasmotaSensorDecoder:
@@ -95,10 +94,10 @@ class TasmotaSensorDecoder:
                     path.append(dkey)
                     if isinstance(dvalue, dict):
                         if "Type" in dvalue:
-                            subdata = deepcopy(dvalue)
-                            del subdata["Type"]
-                            del subdata["Address"]
-                            for dskey, dsvalue in subdata.items():
+                            # Transfer sensor readings, skipping the sensor metadata, without copying.
+                            for dskey, dsvalue in dvalue.items():
+                                if dskey in ("Type", "Address"):
+                                    continue
                                 path.append(dskey)
                                 effective_key = ".".join(path)
                                 data[effective_key] = dsvalue
@@ -1,9 +1,25 @@
+from enum import Enum
+
+
+class ErrorCode(Enum):
+    """
+    Stable identifiers for error conditions, independent of their human-readable messages.
+    """
+
+    DMS_SHAPE = "dms-shape"
+    DMS_ADDRESS = "dms-address"
+    UNKNOWN_OPERATION = "unknown-operation"
+
+
 class MessageFormatError(Exception):
-    pass
+    def __init__(self, *args, code: ErrorCode = None, **kwargs):
+        self.code = code
+        super().__init__(*args, **kwargs)
 
 
 class UnknownOperationError(Exception):
-    def __init__(self, *args, operation=None, record=None, **kwargs):
+    def __init__(self, *args, operation=None, record=None, code: ErrorCode = ErrorCode.UNKNOWN_OPERATION, **kwargs):
         self.operation = operation
         self.record = record
+        self.code = code
         super().__init__(*args, **kwargs)
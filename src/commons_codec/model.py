@@ -14,7 +14,7 @@ else:
     from backports.strenum import StrEnum  # pragma: no cover
 
 
-@define(frozen=True)
+@define(frozen=True, cache_hash=True)
 class TableAddress:
     schema: str
     table: str
@@ -75,16 +75,42 @@ class ColumnTypeMapStore(dict):
         return cls.from_dict(json.loads(payload))
 
 
-@define
+# SQL parameters of a single record, either named or positional.
+SQLRecordParameters = t.Union[t.Mapping[str, t.Any], t.Tuple[t.Any, ...]]
+
+
+@define(frozen=True)
 class SQLOperation:
     """
     Bundle data about an SQL operation, including statement and parameters.
 
-    Parameters can be a single dictionary or a list of dictionaries.
+    Parameters can be a single dictionary or tuple, or a list thereof.
+    Instances are slotted and immutable, because they are produced per event.
     """
 
     statement: str
-    parameters: t.Optional[t.Union[t.Mapping[str, t.Any], t.List[t.Mapping[str, t.Any]]]] = None
+    parameters: t.Optional[t.Union[SQLRecordParameters, t.Sequence[SQLRecordParameters]]] = None
+
+    @classmethod
+    def converge(cls, operations: t.Iterable["SQLOperation"]) -> t.List["SQLOperation"]:
+        """
+        Converge consecutive DML operations sharing the same SQL statement into a single
+        operation with a list of parameters, suitable for an `executemany` invocation.
+        Operations without parameters, like DDL, are passed through. The order is retained.
+        """
+        result: t.List[SQLOperation] = []
+        for operation in operations:
+            if operation.parameters is None:
+                result.append(operation)
+                continue
+            # Operations passed in carry parameters of a single record each.
+            parameters = t.cast(SQLRecordParameters, operation.parameters)
+            previous = result[-1] if result else None
+            if previous and previous.statement == operation.statement and isinstance(previous.parameters, list):
+                previous.parameters.append(parameters)
+            else:
+                result.append(cls(operation.statement, [parameters]))
+        return result
 
 
 @define
@@ -3,10 +3,13 @@
 
 import logging
 import typing as t
+from functools import lru_cache
 
 import simplejson as json
+from attr import Factory
+from attrs import define
 
-from commons_codec.exception import MessageFormatError, UnknownOperationError
+from commons_codec.exception import ErrorCode, MessageFormatError, UnknownOperationError
 from commons_codec.model import (
     ColumnType,
     ColumnTypeMapStore,
@@ -14,12 +17,47 @@ from commons_codec.model import (
     SQLOperation,
     SQLParameterizedSetClause,
     SQLParameterizedWhereClause,
+    SQLRecordParameters,
     TableAddress,
 )
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8192)
+def _table_address(schema: str, table: str) -> TableAddress:
+    """
+    Provide a shared table address instance, cached across events of the same table.
+    Its quoted full-qualified table name is computed once, on first access.
+    """
+    return TableAddress(schema=schema, table=table)
+
+
+@lru_cache(maxsize=8192)
+def _quote_element(container: str, column: str) -> str:
+    """
+    Compute the SQL expression addressing a column within the container column, cached across events.
+    """
+    return f"{container}['{column}']"
+
+
+@define
+class TableState:
+    """
+    Manage precomputed SQL statements of a single table.
+
+    DDL events are rare, while DML events are hot. Statements are rendered once,
+    when processing a `create-table` control message, or on first use, and reused
+    by subsequent events. UPDATE statements depend on the set of columns present
+    in an event, so they are cached per column set.
+    """
+
+    insert_sql: str
+    delete_sql: t.Union[str, None] = None
+    update_sql: t.Dict[t.FrozenSet[str], str] = Factory(dict)
+    update_params: t.Dict[t.FrozenSet[str], t.Tuple[str, ...]] = Factory(dict)
+
+
 class DMSTranslatorCrateDBRecord:
     """
     Translate DMS full-load and cdc events into CrateDB SQL statements.
@@ -51,52 +89,74 @@ class DMSTranslatorCrateDBRecord:
         # Relevant CDC events are delivered with an empty table name, so some valid
         # name needs to be selected anyway. The outcome of this is that AWS DMS special
         # tables will be created within the sink database, like `dms.awsdms_apply_exceptions`.
-        if self.table and self.table.startswith("awsdms_"):
+        # Schemas of individual tables can be rewritten by configuration upfront.
+        rewrite = None
+        if self.schema is not None and self.table is not None:
+            rewrite = self.container.schema_rewrites.get((self.schema, self.table))
+        if rewrite is not None:
+            self.schema = rewrite
+        elif self.table and self.table.startswith("awsdms_"):
             self.schema = "dms"
 
         # Sanity checks.
         if not self.metadata or not self.operation:
             message = "Record not in DMS format: metadata and/or operation is missing"
             logger.error(message)
-            raise MessageFormatError(message)
+            raise MessageFormatError(message, code=ErrorCode.DMS_SHAPE)
 
         if not self.schema or not self.table:
             message = f"Schema or table name missing or empty: schema={self.schema}, table={self.table}"
             logger.error(message)
-            raise MessageFormatError(message)
+            raise MessageFormatError(message, code=ErrorCode.DMS_ADDRESS)
 
-        self.address: TableAddress = TableAddress(schema=self.schema, table=self.table)
+        self.address: TableAddress = _table_address(self.schema, self.table)
+        self.fqn: str = self.address.fqn
 
-        self.container.primary_keys.setdefault(self.address, [])
-        self.container.column_types.setdefault(self.address, {})
-        self.primary_keys: t.List[str] = self.container.primary_keys[self.address]
-        self.column_types: t.Dict[str, ColumnType] = self.container.column_types[self.address]
+        self.primary_keys: t.List[str] = self.container.primary_keys.setdefault(self.address, [])
+        self.column_types: t.Dict[str, ColumnType] = self.container.column_types.setdefault(self.address, {})
+
+        self.positional: bool = self.container.binding_style == "positional"
+        # Control messages about table creation (re)compile the table state when processed.
+        self.state: TableState
+        if self.operation != "create-table":
+            self.state = self.container.table_state.get(self.address) or self.compile_state()
 
     def to_sql(self) -> SQLOperation:
+        parameters: SQLRecordParameters
         if self.operation == "create-table":
-            pks = self.control.get("table-def", {}).get("primary-key")
+            table_def = self.control.get("table-def", {})
+            pks = table_def.get("primary-key")
             if pks:
-                self.primary_keys += pks
+                # Replace in place, because the list is shared with the primary key store.
+                self.primary_keys[:] = pks
+            self.state = self.compile_state(columns=table_def.get("columns"))
             # TODO: What about dropping tables first?
-            return SQLOperation(f"CREATE TABLE IF NOT EXISTS {self.address.fqn} ({self.DATA_COLUMN} OBJECT(DYNAMIC));")
+            return SQLOperation(f"CREATE TABLE IF NOT EXISTS {self.fqn} ({self.DATA_COLUMN} OBJECT(DYNAMIC));")
 
         elif self.operation in ["load", "insert"]:
             self.decode_data()
-            sql = f"INSERT INTO {self.address.fqn} ({self.DATA_COLUMN}) VALUES (:record);"
-            parameters = {"record": self.data}
+            sql = self.state.insert_sql
+            parameters = (self.data,) if self.positional else {"record": self.data}
 
         elif self.operation == "update":
             self.decode_data()
-            set_clause = self.update_clause()
-            where_clause = self.keys_to_where()
-            sql = f"UPDATE {self.address.fqn} SET {set_clause.to_sql()} WHERE {where_clause.to_sql()};"
-            parameters = set_clause.values  # noqa: PD011
-            parameters.update(where_clause.values)
+            columns = frozenset(self.data)
+            sql = self.state.update_sql.get(columns) or self.compile_update(columns)
+            if self.positional:
+                parameters = tuple(map(self.data.get, self.state.update_params[columns]))
+            elif columns.issuperset(self.primary_keys):
+                # The record data already includes all values, so a shallow copy suffices.
+                # It is still a copy, so parameters and the event can be modified independently.
+                parameters = dict(self.data)
+            else:
+                parameters = {**self.data, **self.primary_key_values()}
 
         elif self.operation == "delete":
-            where_clause = self.keys_to_where()
-            sql = f"DELETE FROM {self.address.fqn} WHERE {where_clause.to_sql()};"
-            parameters = where_clause.values  # noqa: PD011
+            sql = self.state.delete_sql or self.compile_delete()
+            if self.positional:
+                parameters = tuple(map(self.data.get, self.primary_keys))
+            else:
+                parameters = self.primary_key_values()
 
         else:
             message = f"Unknown CDC event operation: {self.operation}"
@@ -105,7 +165,52 @@ class DMSTranslatorCrateDBRecord:
 
         return SQLOperation(sql, parameters)
 
-    def update_clause(self) -> SQLParameterizedSetClause:
+    def compile_state(self, columns: t.Union[t.Iterable[str], None] = None) -> TableState:
+        """
+        Render SQL statements of the current table, and register them with the container.
+
+        When the column layout is known, for example from a `create-table` control message,
+        the UPDATE statement for the full set of columns is rendered upfront as well.
+        """
+        placeholder = "?" if self.positional else ":record"
+        state = TableState(insert_sql=f"INSERT INTO {self.fqn} ({self.DATA_COLUMN}) VALUES ({placeholder});")
+        self.container.table_state[self.address] = self.state = state
+        if self.primary_keys:
+            self.compile_delete()
+            if columns:
+                self.compile_update(frozenset(columns))
+        return state
+
+    def compile_update(self, columns: t.FrozenSet[str]) -> str:
+        """
+        Render UPDATE statement for the given set of columns, and cache it,
+        together with the order of its parameters, used for positional binding.
+        """
+        set_clause = self.update_clause(data=dict.fromkeys(sorted(columns)))
+        where_clause = self.keys_to_where()
+        sql = f"UPDATE {self.fqn} SET {set_clause.to_sql()} WHERE {where_clause.to_sql()};"
+        self.state.update_sql[columns] = sql
+        self.state.update_params[columns] = (*set_clause.values, *where_clause.values)
+        return sql
+
+    def compile_delete(self) -> str:
+        """
+        Render DELETE statement, and cache it.
+        """
+        where_clause = self.keys_to_where()
+        sql = f"DELETE FROM {self.fqn} WHERE {where_clause.to_sql()};"
+        self.state.delete_sql = sql
+        return sql
+
+    def primary_key_values(self) -> t.Dict[str, t.Any]:
+        """
+        Compute SQL parameters for the WHERE clause, based on primary key definition and current record's data.
+        """
+        if not self.primary_keys:
+            raise ValueError("Unable to invoke DML operation without primary key information")
+        return {key_name: self.data.get(key_name) for key_name in self.primary_keys}
+
+    def update_clause(self, data: t.Dict[str, t.Any]) -> SQLParameterizedSetClause:
         """
         Serializes an image to a comma-separated list of column/values pairs
         that can be used in the `SET` clause of an `UPDATE` statement.
@@ -118,11 +223,11 @@ class DMSTranslatorCrateDBRecord:
         data['age'] = '33', data['attributes'] = '{"foo": "bar"}', data['name'] = 'John'
         """
         clause = SQLParameterizedSetClause()
-        for column, value in self.event["data"].items():
+        for column, value in data.items():
             # Skip primary key columns, they cannot be updated.
             if column in self.primary_keys:
                 continue
-            clause.add(lval=f"{self.DATA_COLUMN}['{column}']", value=value, name=column)
+            clause.add(lval=_quote_element(self.DATA_COLUMN, column), value=value, name=column, rval=self.rval)
         return clause
 
     def decode_data(self):
@@ -134,14 +239,21 @@ class DMSTranslatorCrateDBRecord:
 
         OUT:
         {"age": 30, "attributes": {"foo": "bar"}, "id": 42, "name": "John"}
+
+        The input event is not modified. The record data is copied on write,
+        only when a value actually needs to be converted.
         """
+        data = None
         for column_name, column_type in self.column_types.items():
             if column_name in self.data:
                 value = self.data[column_name]
                 # DMS marshals JSON|JSONB to CLOB, aka. string. Apply a countermeasure.
                 if column_type is ColumnType.MAP and isinstance(value, str):
-                    value = json.loads(value)
-                self.data[column_name] = value
+                    if data is None:
+                        data = dict(self.data)
+                    data[column_name] = json.loads(value)
+        if data is not None:
+            self.data = data
 
     def keys_to_where(self) -> SQLParameterizedWhereClause:
         """
@@ -152,9 +264,16 @@ class DMSTranslatorCrateDBRecord:
         clause = SQLParameterizedWhereClause()
         for key_name in self.primary_keys:
             key_value = self.data.get(key_name)
-            clause.add(lval=f"{self.DATA_COLUMN}['{key_name}']", value=key_value, name=key_name)
+            clause.add(lval=_quote_element(self.DATA_COLUMN, key_name), value=key_value, name=key_name, rval=self.rval)
         return clause
 
+    @property
+    def rval(self) -> t.Union[str, None]:
+        """
+        The SQL placeholder for clause values. `None` selects named placeholders.
+        """
+        return "?" if self.positional else None
+
 
 class DMSTranslatorCrateDB:
     """
@@ -163,6 +282,14 @@ class DMSTranslatorCrateDB:
     The SQL DDL schema for CrateDB:
     CREATE TABLE <tablename> (data OBJECT(DYNAMIC));
 
+    By default, SQL statements use named placeholders, and parameters are
+    dictionaries. Using `binding_style="positional"`, SQL statements use
+    `?` placeholders, and parameters are tuples of values, in order.
+
+    Using `schema_rewrites`, events can be diverted to different schemas,
+    by mapping `(schema, table)` tuples to schema names. By default, AWS DMS
+    special tables like `awsdms_apply_exceptions` are diverted to the `dms` schema.
+
     Blueprint:
     https://www.cockroachlabs.com/docs/stable/aws-dms
     """
@@ -171,9 +298,28 @@ class DMSTranslatorCrateDB:
         self,
         primary_keys: PrimaryKeyStore = None,
         column_types: ColumnTypeMapStore = None,
+        binding_style: t.Literal["named", "positional"] = "named",
+        schema_rewrites: t.Dict[t.Tuple[str, str], str] = None,
     ):
+        if binding_style not in ("named", "positional"):
+            raise ValueError(f"Unknown binding style: {binding_style}")
+        self.binding_style = binding_style
         self.primary_keys = primary_keys or PrimaryKeyStore()
+        # Remember configured primary keys, to restore them when clearing the cache.
+        # Lists are copied, because control messages update them in place.
+        self.primary_keys_configured = {address: list(keys) for address, keys in self.primary_keys.items()}
         self.column_types = column_types or ColumnTypeMapStore()
+        self.table_state: t.Dict[TableAddress, TableState] = {}
+        self.schema_rewrites: t.Dict[t.Tuple[str, str], str] = dict(schema_rewrites or {})
+
+    def clear_cache(self):
+        """
+        Forget schema knowledge learned from control messages, i.e. primary keys and precomputed statements.
+        Configured primary keys, column types, and schema rewrites are retained.
+        """
+        self.primary_keys.clear()
+        self.primary_keys.update({address: list(keys) for address, keys in self.primary_keys_configured.items()})
+        self.table_state.clear()
 
     def to_sql(self, record: t.Dict[str, t.Any]) -> SQLOperation:
         """
@@ -181,3 +327,14 @@ class DMSTranslatorCrateDB:
         """
         record_decoded = DMSTranslatorCrateDBRecord(event=record, container=self)
         return record_decoded.to_sql()
+
+    def to_sql_many(self, records: t.Iterable[t.Dict[str, t.Any]]) -> t.List[SQLOperation]:
+        """
+        Produce SQL operations from a batch of CDC event records.
+
+        Consecutive DML operations sharing the same SQL statement, i.e. the same
+        table, operation, and column set, are converged into a single operation
+        with a list of parameters, suitable for an `executemany` invocation.
+        The order of events is retained.
+        """
+        return SQLOperation.converge(map(self.to_sql, records))
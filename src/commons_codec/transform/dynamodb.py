@@ -2,9 +2,9 @@
 # Distributed under the terms of the LGPLv3 license, see LICENSE.
 import decimal
 import logging
+import sys
 import typing as t
 
-import toolz
 from sqlalchemy_cratedb.support import quote_relation_name
 
 from commons_codec.model import (
@@ -24,22 +24,63 @@ DYNAMODB_CONTEXT.traps[decimal.Rounded] = False
 
 RecordType = t.Dict[str, t.Any]
 
+# Event sources accepted by the CDC translator.
+_ALLOWED_SOURCES = frozenset(("aws:dynamodb",))
+
+
+def _identity(value):
+    return value
+
 
 class CrateDBTypeDeserializer(TypeDeserializer):
+    def __init__(self):
+        # Dispatch table, mapping DynamoDB type tags to bound deserializer methods.
+        self.handlers: t.Dict[str, t.Callable[[t.Any], t.Any]] = {
+            "NULL": self._deserialize_null,
+            "BOOL": self._deserialize_bool,
+            "N": self._deserialize_n,
+            # Strings and binaries, including empty and null values, pass through as-is.
+            # A plain function saves the bound method indirection on the most frequent types.
+            "S": _identity,
+            "B": _identity,
+            "NS": self._deserialize_ns,
+            "SS": self._deserialize_ss,
+            "BS": self._deserialize_bs,
+            "L": self._deserialize_l,
+            "M": self._deserialize_m,
+        }
+
+    def deserialize(self, value):
+        """
+        Deserialize DynamoDB data types, dispatching by type tag using a lookup table.
+        Other spellings of type tags, and errors, are handled by the base implementation.
+        """
+        return self._dispatch(value)
+
+    def _dispatch(self, value):
+        try:
+            dynamodb_type = next(iter(value))
+            handler = self.handlers[dynamodb_type]
+        except (StopIteration, KeyError, TypeError):
+            return super().deserialize(value)
+        return handler(value[dynamodb_type])
+
     def _deserialize_n(self, value):
-        return float(super()._deserialize_n(value))
+        # Convert to `float` directly, without the detour through `Decimal`.
+        return float(value)
 
     def _deserialize_b(self, value):
         return value
 
     def _deserialize_ns(self, value):
-        return list(super()._deserialize_ns(value))
+        # Convert and sort within C-level builtins, yielding a deterministic order.
+        return sorted(set(map(float, value)))
 
     def _deserialize_ss(self, value):
-        return list(super()._deserialize_ss(value))
+        return list(set(value))
 
     def _deserialize_bs(self, value):
-        return list(super()._deserialize_bs(value))
+        return list(set(value))
 
     def _deserialize_l(self, value):
         """
@@ -49,24 +90,31 @@ class CrateDBTypeDeserializer(TypeDeserializer):
         https://github.com/crate/commons-codec/issues/28
         """
 
-        # Deserialize list as-is.
-        result = TaggableList([self.deserialize(v) for v in value])
-        result.set_tag("varied", False)
+        # Short-circuit empty lists.
+        if not value:
+            result = TaggableList()
+            result.set_tag("varied", False)
+            return result
 
-        # If it's not an empty list, check if inner types are varying.
-        # If so, tag the result list accordingly.
+        # Deserialize list as-is, dispatching through the lookup table right away.
+        result = TaggableList(map(self._dispatch, value))
+
+        # Check if inner types are varying, and tag the result list accordingly.
         # It doesn't work on the result list itself, but on the DynamoDB
         # data structure instead, comparing the single/dual-letter type
         # identifiers.
-        if value:
-            dynamodb_type_first = list(value[0].keys())[0]
-            for v in value:
-                dynamodb_type_current = list(v.keys())[0]
-                if dynamodb_type_current != dynamodb_type_first:
-                    result.set_tag("varied", True)
-                    break
+        result.set_tag("varied", len({next(iter(v)) for v in value}) > 1)
         return result
 
+    def _deserialize_m(self, value):
+        # Short-circuit empty maps.
+        if not value:
+            return {}
+
+        # Dispatch through the lookup table right away.
+        dispatch = self._dispatch
+        return {k: dispatch(v) for k, v in value.items()}
+
 
 class DynamoTranslatorBase:
     """
@@ -132,29 +180,43 @@ class DynamoTranslatorBase:
 
         -- https://docs.aws.amazon.com/amazondynamodb/latest/developerguide/HowItWorks.NamingRulesDataTypes.html#HowItWorks.DataTypeDescriptors
         """
-        record = toolz.valmap(self.deserializer.deserialize, item)
+        return UniversalRecord(**self.decode_parameters(item, key_names))
 
+    def decode_parameters(
+        self, item: t.Dict[str, t.Any], key_names: t.Union[t.Iterable[str], None] = None
+    ) -> t.Dict[str, RecordType]:
+        """
+        Deserialize DynamoDB JSON record into the `pk`, `typed`, and `untyped` SQL parameters,
+        without materializing an intermediary `UniversalRecord`.
+        """
         pk = {}
+        typed = {}
         untyped = {}
-        pk_names = key_names or []
-        if not pk_names and self.primary_key_schema is not None:
-            pk_names = self.primary_key_schema.keys()
-        for key, value in record.items():
+        # Derive primary key names from the schema on each call, because the schema may change.
+        pk_names = key_names or (self.primary_key_schema.keys() if self.primary_key_schema is not None else ())
+
+        # Deserialize and partition the record in a single pass.
+        # Top-level attribute names repeat across records, so intern them. This lets
+        # batches of decoded records share their key strings. Keys of nested maps are
+        # user data of unbounded variety, so they are not interned.
+        deserialize = self.deserializer.deserialize
+        for name, dynamodb_value in item.items():
+            key = sys.intern(name)
+            value = deserialize(dynamodb_value)
             if key in pk_names:
                 pk[key] = value
-            if isinstance(value, TaggableList) and value.get_tag("varied", False):
+            elif isinstance(value, TaggableList) and value.get_tag("varied", False):
                 untyped[key] = value
-        record = toolz.dissoc(record, *pk.keys())
-        record = toolz.dissoc(record, *untyped.keys())
-        return UniversalRecord(pk=pk, typed=record, untyped=untyped)
+            else:
+                typed[key] = value
+        return {"pk": pk, "typed": typed, "untyped": untyped}
 
 
 class DynamoDBFullLoadTranslator(DynamoTranslatorBase):
-    def to_sql(self, data: t.Union[RecordType, t.List[RecordType]]) -> SQLOperation:
-        """
-        Produce INSERT SQL operations (SQL statement and parameters) from DynamoDB record(s).
-        """
-        sql = (
+    def __init__(self, table_name: str, primary_key_schema: PrimaryKeySchema = None):
+        super().__init__(table_name=table_name, primary_key_schema=primary_key_schema)
+        # Render SQL statement once.
+        self.insert_sql = (
             f"INSERT INTO {self.table_name} ("
             f"{self.PK_COLUMN}, "
             f"{self.TYPED_COLUMN}, "
@@ -164,10 +226,15 @@ class DynamoDBFullLoadTranslator(DynamoTranslatorBase):
             f":typed, "
             f":untyped);"
         )
+
+    def to_sql(self, data: t.Union[RecordType, t.List[RecordType]]) -> SQLOperation:
+        """
+        Produce INSERT SQL operations (SQL statement and parameters) from DynamoDB record(s).
+        """
         if not isinstance(data, list):
             data = [data]
-        parameters = [self.decode_record(record).to_dict() for record in data]
-        return SQLOperation(sql, parameters)
+        parameters = [self.decode_parameters(record) for record in data]
+        return SQLOperation(self.insert_sql, parameters)
 
 
 class DynamoDBCDCTranslator(DynamoTranslatorBase):
@@ -181,6 +248,34 @@ class DynamoDBCDCTranslator(DynamoTranslatorBase):
     https://www.singlestore.com/blog/cdc-data-from-dynamodb-to-singlestore-using-dynamodb-streams/
     """
 
+    def __init__(self, table_name: str, primary_key_schema: PrimaryKeySchema = None):
+        super().__init__(table_name=table_name, primary_key_schema=primary_key_schema)
+        # Render SQL statements once.
+        self.insert_sql = (
+            f"INSERT INTO {self.table_name} ("
+            f"{self.PK_COLUMN}, "
+            f"{self.TYPED_COLUMN}, "
+            f"{self.UNTYPED_COLUMN}"
+            f") VALUES ("
+            f":pk, "
+            f":typed, "
+            f":untyped) "
+            f"ON CONFLICT DO NOTHING;"
+        )
+        self.update_sql = (
+            f"UPDATE {self.table_name} "
+            f"SET {self.TYPED_COLUMN}=:typed, {self.UNTYPED_COLUMN}=:untyped "
+            f"WHERE {self.PK_COLUMN}=:pk;"
+        )
+        self.delete_sql = f"DELETE FROM {self.table_name} WHERE {self.PK_COLUMN}=:pk;"
+
+        # Map CDC event names to SQL statements.
+        self.event_statements: t.Dict[str, str] = {
+            "INSERT": self.insert_sql,
+            "MODIFY": self.update_sql,
+            "REMOVE": self.delete_sql,
+        }
+
     def to_sql(self, event: t.Dict[str, t.Any]) -> SQLOperation:
         """
         Produce INSERT|UPDATE|DELETE SQL statement from INSERT|MODIFY|REMOVE CDC event record.
@@ -188,48 +283,34 @@ class DynamoDBCDCTranslator(DynamoTranslatorBase):
         event_source = event.get("eventSource")
         event_name = event.get("eventName")
 
-        if event_source != "aws:dynamodb":
+        if event_source not in _ALLOWED_SOURCES:
             raise ValueError(f"Unknown eventSource: {event_source}")
 
-        if event_name == "INSERT":
-            record = self.decode_event(event["dynamodb"])
-            sql = (
-                f"INSERT INTO {self.table_name} ("
-                f"{self.PK_COLUMN}, "
-                f"{self.TYPED_COLUMN}, "
-                f"{self.UNTYPED_COLUMN}"
-                f") VALUES ("
-                f":pk, "
-                f":typed, "
-                f":untyped) "
-                f"ON CONFLICT DO NOTHING;"
-            )
-            parameters = record.to_dict()
-
-        elif event_name == "MODIFY":
-            record = self.decode_event(event["dynamodb"])
-            sql = (
-                f"UPDATE {self.table_name} "
-                f"SET {self.TYPED_COLUMN}=:typed, {self.UNTYPED_COLUMN}=:untyped "
-                f"WHERE {self.PK_COLUMN}=:pk;"
-            )
-            parameters = record.to_dict()
-
-        elif event_name == "REMOVE":
-            record = self.decode_event(event["dynamodb"])
-            sql = f"DELETE FROM {self.table_name} WHERE {self.PK_COLUMN}=:pk;"
-            parameters = record.to_dict()
-
-        else:
+        sql = self.event_statements.get(event_name) if event_name is not None else None
+        if sql is None:
             raise ValueError(f"Unknown CDC event name: {event_name}")
 
-        return SQLOperation(sql, parameters)
+        return SQLOperation(sql, self.decode_event_parameters(event["dynamodb"]))
+
+    def to_sql_many(self, events: t.Iterable[t.Dict[str, t.Any]]) -> t.List[SQLOperation]:
+        """
+        Produce SQL operations from a batch of CDC event records.
+
+        Consecutive events of the same type are converged into a single operation
+        with a list of parameters, suitable for an `executemany` invocation.
+        The order of events is retained.
+        """
+        return SQLOperation.converge(map(self.to_sql, events))
 
     def decode_event(self, event: t.Dict[str, t.Any]) -> UniversalRecord:
-        # That's for INSERT+MODIFY.
-        if "NewImage" in event:
-            return self.decode_record(event["NewImage"], event["Keys"].keys())
+        return UniversalRecord(**self.decode_event_parameters(event))
 
-        # That's for REMOVE.
-        else:
-            return self.decode_record(event["Keys"], event["Keys"].keys())
+    def decode_event_parameters(self, event: t.Dict[str, t.Any]) -> t.Dict[str, RecordType]:
+        """
+        Decode the `dynamodb` part of a CDC event into SQL parameters.
+
+        That's `NewImage` for INSERT+MODIFY, and `Keys` for REMOVE.
+        `OldImage` is ignored by design, and never deserialized.
+        """
+        keys = event["Keys"]
+        return self.decode_parameters(event.get("NewImage", keys), keys.keys())
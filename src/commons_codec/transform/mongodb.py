@@ -6,7 +6,8 @@ import calendar
 import datetime as dt
 import logging
 import typing as t
-from functools import lru_cache
+import uuid
+from functools import cached_property, lru_cache
 from typing import Iterable
 
 import bson
@@ -34,6 +35,18 @@ def all_bson_types() -> t.Tuple[t.Type, ...]:
     return tuple(_types)
 
 
+# Decoders for single-key MongoDB Extended JSON scalars, whose outcome does not depend on
+# converter options. They produce the same results like the generic path through
+# `bson.json_util.object_hook`, but skip its cascade of marker checks.
+EXTENDED_JSON_SCALAR_DECODERS: t.Dict[str, t.Callable[[t.Any], t.Any]] = {
+    "$oid": lambda value: str(bson.ObjectId(value)),
+    "$numberInt": int,
+    "$numberLong": lambda value: str(int(value)),
+    "$numberDouble": float,
+    "$symbol": str,
+}
+
+
 @define
 class MongoDBCrateDBConverter:
     """
@@ -119,8 +132,19 @@ class MongoDBCrateDBConverter:
 
         out: t.Any
 
-        # Special handling for datetime representation in NUMBERLONG format (emulated depth-first).
+        # Fast path for scalar types, using a dispatch table.
         type_ = next(iter(value))  # Get key of first item in dictionary.
+        decoder = EXTENDED_JSON_SCALAR_DECODERS.get(type_)
+        if decoder is not None and len(value) == 1:
+            return decoder(value[type_])
+
+        # Fast path for UUIDs in canonical format, constructing them from raw bytes.
+        if type_ == "$binary" and len(value) == 1:
+            binary = value["$binary"]
+            if isinstance(binary, dict) and binary.get("subType") == "04" and len(binary) == 2:
+                return str(uuid.UUID(bytes=base64.b64decode(binary["base64"])))
+
+        # Special handling for datetime representation in NUMBERLONG format (emulated depth-first).
         if type_ == "$date" and isinstance(value["$date"], dict):
             value = {"$date": int(value["$date"]["$numberLong"])}
 
@@ -226,10 +250,11 @@ class MongoDBTranslatorBase:
         self.table_name = quote_relation_name(table_name)
         self.converter = converter or MongoDBCrateDBConverter(timestamp_to_epoch=True, timestamp_use_milliseconds=True)
 
-    @property
+    @cached_property
     def sql_ddl(self):
         """
         Define SQL DDL statement for creating table in CrateDB that stores re-materialized CDC events.
+        The statement is rendered once, on first access.
         """
         return (
             f"CREATE TABLE IF NOT EXISTS {self.table_name} ({self.ID_COLUMN} TEXT, {self.DATA_COLUMN} OBJECT(DYNAMIC));"
@@ -241,6 +266,13 @@ class MongoDBFullLoadTranslator(MongoDBTranslatorBase):
     Translate a MongoDB document into a CrateDB document.
     """
 
+    def __init__(self, table_name: str, converter: t.Union[MongoDBCrateDBConverter, None] = None):
+        super().__init__(table_name=table_name, converter=converter)
+        # Render SQL statement once.
+        self.insert_sql = (
+            f"INSERT INTO {self.table_name} ({self.ID_COLUMN}, {self.DATA_COLUMN}) VALUES (:oid, :record);"
+        )
+
     @staticmethod
     def get_document_key(record: t.Mapping[str, t.Any]) -> str:
         """
@@ -257,16 +289,12 @@ class MongoDBFullLoadTranslator(MongoDBTranslatorBase):
         if not isinstance(data, Cursor) and not isinstance(data, list):
             data = [data]
 
-        # Define SQL INSERT statement.
-        sql = f"INSERT INTO {self.table_name} ({self.ID_COLUMN}, {self.DATA_COLUMN}) VALUES (:oid, :record);"
-
         # Converge multiple MongoDB documents into SQL parameters for `executemany` operation.
-        parameters: t.List[Document] = []
-        for record in self.converter.decode_documents(data):
-            oid: str = self.get_document_key(record)
-            parameters.append({"oid": oid, "record": record})
+        parameters: t.List[Document] = [
+            {"oid": self.get_document_key(record), "record": record} for record in self.converter.decode_documents(data)
+        ]
 
-        return SQLOperation(sql, parameters)
+        return SQLOperation(self.insert_sql, parameters)
 
 
 class MongoDBCDCTranslator(MongoDBTranslatorBase):
@@ -21,13 +21,10 @@ def is_number(s):
     except (TypeError, ValueError):
         pass
 
-    try:
-        import unicodedata
-
-        if isinstance(s, str):
-            return all(map(unicodedata.numeric, s))
-    except (TypeError, ValueError):
-        pass
+    # Check for Unicode numerals. `str.isnumeric()` accepts exactly the characters
+    # which have a `unicodedata.numeric()` value, without raising exceptions.
+    if isinstance(s, str):
+        return s.isnumeric()
 
     return False
 
@@ -1,13 +1,44 @@
 import datetime as dt
 import logging
+import re
 import typing as t
 
 logger = logging.getLogger(__name__)
 
+# Common date formats which can be parsed without `dateutil`.
+ISO_DATE_PATTERN = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}(?:[T ]|$)")
+US_DATE_PATTERN = re.compile(r"([0-9]{1,2})/([0-9]{1,2})/([0-9]{4})$")
+
+
+def _parse_datetime_fast(value: str) -> t.Union[dt.datetime, None]:
+    """
+    Parse naive ISO 8601 and US (month first) dates using the standard library,
+    yielding the same results like `dateutil`. Return `None` for anything else.
+    """
+    if ISO_DATE_PATTERN.match(value):
+        try:
+            result = dt.datetime.fromisoformat(value)
+        except ValueError:
+            return None
+        # Leave time zone handling to `dateutil`, which uses different `tzinfo` objects.
+        return result if result.tzinfo is None else None
+    match = US_DATE_PATTERN.match(value)
+    if match:
+        month, day, year = map(int, match.groups())
+        try:
+            return dt.datetime(year, month, day)
+        except ValueError:
+            return None
+    return None
+
 
 def to_datetime(value: t.Any, on_error: t.Literal["raise", "ignore"] = "ignore") -> t.Union[dt.datetime, None]:
     if isinstance(value, dt.datetime):
         return value
+    if isinstance(value, str):
+        result = _parse_datetime_fast(value)
+        if result is not None:
+            return result
     import dateutil.parser
 
     try:
@@ -1,8 +1,10 @@
 import typing as t
 from collections import OrderedDict
+from functools import lru_cache
 
 import attr
 import toolz
+import yaml
 from attr import Factory
 from attrs import define
 from cattrs.preconf.json import make_converter as make_json_converter
@@ -10,11 +12,30 @@ from cattrs.preconf.pyyaml import make_converter as make_yaml_converter
 
 from zyp.util.data import no_disabled_false, no_privates_no_nulls_no_empties
 
+# Use the libyaml-based loader when PyYAML has been built with it.
+YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 Record = t.Dict[str, t.Any]
 Collection = t.Iterable[Record]
 DictOrList = t.Union[Record, Collection]
 
 
+@lru_cache(maxsize=None)
+def json_converter():
+    """
+    Provide a shared JSON converter, so its (un)structuring hooks are only generated once.
+    """
+    return make_json_converter(dict_factory=OrderedDict)
+
+
+@lru_cache(maxsize=None)
+def yaml_converter():
+    """
+    Provide a shared YAML converter, so its (un)structuring hooks are only generated once.
+    """
+    return make_yaml_converter(dict_factory=OrderedDict)
+
+
 @define
 class Metadata:
     version: t.Union[int, None] = None
@@ -61,12 +82,10 @@ class Dumpable:
         return attr.asdict(self, dict_factory=OrderedDict, filter=filter_)
 
     def to_json(self) -> str:
-        converter = make_json_converter(dict_factory=OrderedDict)
-        return converter.dumps(self.to_dict())
+        return json_converter().dumps(self.to_dict())
 
     def to_yaml(self) -> str:
-        converter = make_yaml_converter(dict_factory=OrderedDict)
-        return converter.dumps(self.to_dict())
+        return yaml_converter().dumps(self.to_dict())
 
     @classmethod
     def from_dict(cls, data: t.Dict[str, t.Any]):
@@ -74,10 +93,9 @@ class Dumpable:
 
     @classmethod
     def from_json(cls, json_str: str):
-        converter = make_json_converter(dict_factory=OrderedDict)
-        return converter.loads(json_str, cls)
+        return json_converter().loads(json_str, cls)
 
     @classmethod
     def from_yaml(cls, yaml_str: str):
-        converter = make_yaml_converter(dict_factory=OrderedDict)
-        return converter.loads(yaml_str, cls)
+        converter = yaml_converter()
+        return converter.structure(yaml.load(yaml_str, Loader=YamlSafeLoader), cls)  # noqa: S506
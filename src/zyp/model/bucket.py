@@ -1,6 +1,7 @@
 import importlib
 import logging
 import typing as t
+from functools import lru_cache
 
 import jmespath
 import jq
@@ -68,7 +69,12 @@ class ValueConverterRule(ConverterRuleBase):
         return ValueConverterRuntimeRule(pointer=pointer, transformer=transformer_function)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _resolve_fun(symbol: str) -> t.Callable:
+        """
+        Resolve transformer function by symbol name.
+        Recipes refer to the same few functions over and over, so resolve each one only once.
+        """
         if "." not in symbol:
             symbol = f"zyp.function.{symbol}"
         modname, symbol = symbol.rsplit(".", 1)
@@ -114,6 +120,21 @@ class FieldRenamer:
         return self
 
     def apply(self, data: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+        # Without any rules, skip copying the data into a key-renaming dictionary.
+        if not self.rules:
+            return data
+
+        # When rules don't chain or collide, rename all keys within a single pass.
+        renames = {rule.old: rule.new for rule in self.rules}
+        targets = set(renames.values())
+        if len(renames) == len(targets) == len(self.rules) and targets.isdisjoint(renames):
+            for old, new in renames.items():
+                if old not in data:
+                    raise KeyError(f"Cannot rename key {old} to {new}: {old} not existing in dict")
+                if new in data:
+                    raise KeyError(f"Cannot rename key {old} to {new}: {new} already in dict")
+            return {renames.get(key, key): value for key, value in data.items()}
+
         d = OrderedDictX(data)
         for rule in self.rules:
             d.rename_key(rule.old, rule.new)
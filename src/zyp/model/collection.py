@@ -29,11 +29,9 @@ class CollectionTransformation(Dumpable):
         if self.pre:
             collection = t.cast(Collection, self.pre.apply(collection))
         if self.bucket:
-            collection_out = []
-            for item in collection:
-                item = self.bucket.apply(item)
-                collection_out.append(item)
-            collection = collection_out
+            # Resolve the bucket transformation once, not per record.
+            apply_bucket = self.bucket.apply
+            collection = [apply_bucket(item) for item in collection]
         if self.post:
             collection = t.cast(Collection, self.post.apply(collection))
         if self.treatment:
@@ -14,6 +14,9 @@ from zyp.util.expression import compile_expression
 
 logger = logging.getLogger(__name__)
 
+# Options are only read while searching, so all JMESPath evaluations share a single instance.
+JMESPATH_OPTIONS = jmespath.Options(dict_cls=collections.OrderedDict)
+
 
 @define
 class MokshaRule:
@@ -38,7 +41,7 @@ class MokshaRuntimeRule:
         if self.disabled:
             return data
         if isinstance(self.transformer, jmespath.parser.ParsedResult):
-            return self.transformer.search(data, options=jmespath.Options(dict_cls=collections.OrderedDict))
+            return self.transformer.search(data, options=JMESPATH_OPTIONS)
         elif isinstance(self.transformer, jq._Program):
             if isinstance(data, map):
                 data = list(data)
@@ -18,26 +18,73 @@ class Treatment(Dumpable):
     prune_invalid_date: t.List[str] = Factory(list)
 
     def apply(self, data: DictOrList) -> DictOrList:
-        if isinstance(data, dict):
-            self.apply_record(data)
-            return {k: self.apply(v) for (k, v) in data.items()}
-        elif isinstance(data, list):
-            return t.cast(list, [self.apply(v) for v in data])
+        """
+        Apply treatment to all records within the data, in place.
+
+        The tree is walked iteratively, processing each record before its
+        children, without copying any containers.
+        """
+        # Without any rules, treating data would only traverse it.
+        if not self.has_rules():
+            return data
+        conversions = self.get_conversions()
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                self.apply_record(node, conversions=conversions)
+                stack.extend(v for v in node.values() if isinstance(v, (dict, list)))
+            elif isinstance(node, list):
+                stack.extend(node)
         return data
 
-    def apply_record(self, data: Record) -> Record:
+    def has_rules(self) -> bool:
+        return any(
+            (
+                self.ignore_complex_lists,
+                self.ignore_field,
+                self.convert_list,
+                self.convert_string,
+                self.convert_dict,
+                self.normalize_complex_lists,
+                self.prune_invalid_date,
+            )
+        )
+
+    def get_conversions(self) -> t.List[t.Tuple[str, type, t.Callable]]:
+        """
+        Compile type conversion rules into `(name, target type, converter)` items,
+        so applying them to a record is a single pass without further rule lookups.
+        """
+        conversions: t.List[t.Tuple[str, type, t.Callable]] = []
+        for name in self.convert_list:
+            conversions.append((name, list, self.to_list))
+        for name in self.convert_string:
+            conversions.append((name, str, str))
+        for rule in self.convert_dict:
+            conversions.append((rule["name"], dict, DictWrapper(rule["wrapper_name"])))
+        return conversions
+
+    def apply_record(
+        self, data: Record, conversions: t.Optional[t.List[t.Tuple[str, type, t.Callable]]] = None
+    ) -> Record:
+        if conversions is None:
+            conversions = self.get_conversions()
+
         # Optionally ignore lists of complex objects.
-        local_ignores = []
         if self.ignore_complex_lists:
+            local_ignores = []
             for k, v in data.items():
                 if self.is_list_of_dicts(v):
                     # Never ignore items in MongoDB Extended JSON format.
                     if v[0] and next(iter(v[0])).startswith("$"):
                         continue
                     local_ignores.append(k)
+            for ignore_name in local_ignores:
+                del data[ignore_name]
 
-        # Apply global and computed ignores.
-        for ignore_name in self.ignore_field + local_ignores:
+        # Apply global ignores.
+        for ignore_name in self.ignore_field:
             if ignore_name in data:
                 del data[ignore_name]
 
@@ -47,22 +94,10 @@ class Treatment(Dumpable):
                 if self.is_list_of_dicts(v):
                     ListOfVaryingObjectsNormalizer(v).apply()
 
-        # Converge certain items to `list` even when defined differently.
-        for to_list_name in self.convert_list:
-            if to_list_name in data and not isinstance(data[to_list_name], list):
-                data[to_list_name] = [data[to_list_name]]
-
-        # Converge certain items to `str` even when defined differently.
-        for name in self.convert_string:
-            if name in data and not isinstance(data[name], str):
-                data[name] = str(data[name])
-
-        # Converge certain items to `dict` even when defined differently.
-        for rule in self.convert_dict:
-            name = rule["name"]
-            wrapper_name = rule["wrapper_name"]
-            if name in data and not isinstance(data[name], dict):
-                data[name] = {wrapper_name: data[name]}
+        # Converge certain items to `list`, `str`, or `dict` even when defined differently.
+        for name, type_, converter in conversions:
+            if name in data and not isinstance(data[name], type_):
+                data[name] = converter(data[name])
 
         # Prune invalid date representations.
         for key in self.prune_invalid_date:
@@ -75,11 +110,27 @@ class Treatment(Dumpable):
 
         return data
 
+    @staticmethod
+    def to_list(value: t.Any) -> t.List[t.Any]:
+        return [value]
+
     @staticmethod
     def is_list_of_dicts(v: t.Any) -> bool:
         return isinstance(v, list) and bool(v) and isinstance(v[0], dict)
 
 
+@define
+class DictWrapper:
+    """
+    Wrap a value into a dictionary, using a fixed key.
+    """
+
+    name: str
+
+    def __call__(self, value: t.Any) -> t.Dict[str, t.Any]:
+        return {self.name: value}
+
+
 @define
 class NormalizerRule:
     """
@@ -6,6 +6,7 @@ else:  # pragma: no cover
     from importlib_resources import files as resource_files
 
 import typing as t
+from functools import lru_cache
 
 import jmespath
 import jq
@@ -19,12 +20,26 @@ jq_functions_path = resource_files("zyp")
 jq_functions_import = f'include "function" {{"search": "{jq_functions_path}"}};'
 
 
+@lru_cache(maxsize=512)
+def compile_jq(expression: str) -> jq._Program:
+    """
+    Compile jq program, including the `zyp` function library.
+
+    Compilation is expensive, and compiled programs are immutable,
+    so programs are cached per expression string.
+    """
+    return jq.compile(f"{jq_functions_import} {expression}")
+
+
+COMPILERS: t.Dict[str, t.Callable[[t.Any], MokshaTransformer]] = {
+    "jmes": jmespath.compile,
+    "jq": compile_jq,
+    "transon": transon.Transformer,
+}
+
+
 def compile_expression(type: str, expression: t.Union[str, TransonTemplate]) -> MokshaTransformer:  # noqa: A002
-    if type == "jmes":
-        return jmespath.compile(expression)
-    elif type == "jq":
-        return jq.compile(f"{jq_functions_import} {expression}")
-    elif type == "transon":
-        return transon.Transformer(expression)
-    else:
+    compiler = COMPILERS.get(type)
+    if compiler is None:
         raise TypeError(f"Compilation failed. Type must be either jmes or jq or transon: {type}")
+    return compiler(expression)
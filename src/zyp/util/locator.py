@@ -12,7 +12,23 @@ not_found = object()
 def swap_node(
     pointer: JsonPointer, value: t.Any, fun: t.Callable = None, on_error: t.Literal["ignore", "raise"] = "ignore"
 ) -> t.Union[JsonPointer, None]:
-    node = pointer.resolve(value, not_found)
+    parts = pointer.parts
+
+    # Replace root node.
+    if not parts:
+        return fun(value) if fun is not None else value
+
+    # Walk the pre-tokenized pointer. Index dictionaries directly, and
+    # let `jsonpointer` handle sequences and other types of containers.
+    parent = value
+    try:
+        for part in parts[:-1]:
+            parent = parent[part] if isinstance(parent, dict) else pointer.walk(parent, part)
+        last = parts[-1]
+        node = parent[last] if isinstance(parent, dict) else pointer.walk(parent, last)
+    except (KeyError, JsonPointerException):
+        node = not_found
+
     if node is not_found:
         msg = f"Element not found: {pointer}"
         logger.debug(msg)
@@ -21,8 +37,10 @@ def swap_node(
         return value
     if fun is not None:
         node = fun(node)
-    inplace = bool(pointer.parts)
-    return pointer.set(value, node, inplace=inplace)
+    if isinstance(parent, dict):
+        parent[last] = node
+        return value
+    return pointer.set(value, node)
 
 
 def to_pointer(pointer: t.Union[str, JsonPointer]) -> JsonPointer:
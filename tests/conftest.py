@@ -3,6 +3,15 @@ from pathlib import Path
 import pytest
 
 
+def assert_exc_msg(ex: pytest.ExceptionInfo, needle: str):
+    """
+    Verify the message of a caught exception contains the given literal text.
+
+    Other than `ExceptionInfo.match`, this does not involve regular expressions.
+    """
+    assert needle in str(ex.value), f"Exception message {str(ex.value)!r} does not contain {needle!r}"
+
+
 @pytest.fixture
 def tts_ttn_full():
     return Path("tests/assets/tts_ttn_full.json")
@@ -1,6 +1,8 @@
 import pytest
+from attr.exceptions import FrozenInstanceError
 
-from commons_codec.model import ColumnType, ColumnTypeMapStore, TableAddress
+from commons_codec.model import ColumnType, ColumnTypeMapStore, SQLOperation, TableAddress
+from tests.conftest import assert_exc_msg
 
 
 def test_table_address_basic():
@@ -17,7 +19,39 @@ def test_table_address_failure():
     ta = TableAddress(schema=None, table="bar")
     with pytest.raises(ValueError) as ex:
         _ = ta.fqn
-    assert ex.match("Unable to compute a full-qualified table name without schema name")
+    assert_exc_msg(ex, "Unable to compute a full-qualified table name without schema name")
+
+
+def test_table_address_layout():
+    ta = TableAddress(schema="foo", table="bar")
+    assert not hasattr(ta, "__dict__")
+    assert {ta: 42}[TableAddress(schema="foo", table="bar")] == 42
+    with pytest.raises(FrozenInstanceError):
+        ta.table = "baz"
+
+
+def test_sql_operation_layout():
+    operation = SQLOperation(statement="SELECT 1;")
+    assert not hasattr(operation, "__dict__")
+    assert operation == SQLOperation(statement="SELECT 1;", parameters=None)
+    with pytest.raises(FrozenInstanceError):
+        operation.statement = "SELECT 2;"
+
+
+def test_sql_operation_converge():
+    operations = SQLOperation.converge(
+        [
+            SQLOperation(statement="CREATE TABLE foo (id INT);"),
+            SQLOperation(statement="INSERT INTO foo (id) VALUES (:id);", parameters={"id": 1}),
+            SQLOperation(statement="INSERT INTO foo (id) VALUES (:id);", parameters={"id": 2}),
+            SQLOperation(statement="DELETE FROM foo WHERE id=:id;", parameters={"id": 1}),
+        ]
+    )
+    assert operations == [
+        SQLOperation(statement="CREATE TABLE foo (id INT);"),
+        SQLOperation(statement="INSERT INTO foo (id) VALUES (:id);", parameters=[{"id": 1}, {"id": 2}]),
+        SQLOperation(statement="DELETE FROM foo WHERE id=:id;", parameters=[{"id": 1}]),
+    ]
 
 
 def test_column_type_map_store_serialize():
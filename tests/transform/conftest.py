@@ -1,6 +1,6 @@
 import pytest
 
-from commons_codec.transform.dynamodb import DynamoDBCDCTranslator, DynamoDBFullLoadTranslator
+from commons_codec.transform.dynamodb import CrateDBTypeDeserializer, DynamoDBCDCTranslator, DynamoDBFullLoadTranslator
 from commons_codec.transform.dynamodb_model import PrimaryKeySchema
 
 RESET_TABLES = [
@@ -31,11 +31,16 @@ def cratedb(cratedb_custom_service):
     yield cratedb_custom_service
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def dynamodb_full_translator_foo():
     return DynamoDBFullLoadTranslator(table_name="foo", primary_key_schema=PrimaryKeySchema().add("id", "S"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def dynamodb_cdc_translator_foo():
     return DynamoDBCDCTranslator(table_name="foo")
+
+
+@pytest.fixture(scope="module")
+def deserializer():
+    return CrateDBTypeDeserializer()
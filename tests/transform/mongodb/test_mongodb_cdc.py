@@ -9,6 +9,7 @@ from bson import ObjectId, Timestamp
 
 from commons_codec.model import SQLOperation
 from commons_codec.transform.mongodb import MongoDBCDCTranslator
+from tests.conftest import assert_exc_msg
 
 MSG_OPERATION_UNKNOWN = {
     "operationType": "foobar",
@@ -102,19 +103,19 @@ def test_decode_cdc_sql_ddl():
 def test_decode_cdc_unknown_event():
     with pytest.raises(ValueError) as ex:
         MongoDBCDCTranslator(table_name="foo").to_sql(MSG_OPERATION_UNKNOWN)
-    assert ex.match("Unknown CDC operation type: foobar")
+    assert_exc_msg(ex, "Unknown CDC operation type: foobar")
 
 
 def test_decode_cdc_optype_missing():
     with pytest.raises(ValueError) as ex:
         MongoDBCDCTranslator(table_name="foo").to_sql(MSG_OPERATION_MISSING)
-    assert ex.match("Operation Type missing or empty: {}")
+    assert_exc_msg(ex, "Operation Type missing or empty: {}")
 
 
 def test_decode_cdc_optype_empty():
     with pytest.raises(ValueError) as ex:
         MongoDBCDCTranslator(table_name="foo").to_sql(MSG_OPERATION_EMPTY)
-    assert ex.match("Operation Type missing or empty: {'operationType': ''}")
+    assert_exc_msg(ex, "Operation Type missing or empty: {'operationType': ''}")
 
 
 def test_decode_cdc_insert():
@@ -1,13 +1,15 @@
 # ruff: noqa: E402
 import datetime as dt
 import typing as t
+from unittest import mock
 
 import pytest
 from attrs import define
 
 pytestmark = pytest.mark.mongodb
 
-from commons_codec.transform.mongodb import MongoDBCrateDBConverter
+from commons_codec.transform.mongodb import EXTENDED_JSON_SCALAR_DECODERS, MongoDBCrateDBConverter
+from tests.conftest import assert_exc_msg
 from zyp.model.bucket import BucketTransformation, ValueConverter
 from zyp.model.collection import CollectionTransformation
 from zyp.model.treatment import Treatment
@@ -38,7 +40,7 @@ def test_epoch_ms_converter_invalid():
     """
     with pytest.raises(ValueError) as ex:
         convert_epoch(None)
-    assert ex.match("Unable to convert datetime value: None")
+    assert_exc_msg(ex, "Unable to convert datetime value: None")
 
 
 def test_iso8601_converter_int():
@@ -62,7 +64,29 @@ def test_iso8601_converter_invalid():
     """
     with pytest.raises(ValueError) as ex:
         convert_iso8601(None)
-    assert ex.match("Unable to convert datetime value: None")
+    assert_exc_msg(ex, "Unable to convert datetime value: None")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"$oid": "56027fcae4b09385a85f9344"},
+        {"$numberInt": "-2147483648"},
+        {"$numberLong": "-9223372036854775808"},
+        {"$numberDouble": "-1.2345678921232E+18"},
+        {"$symbol": "foo"},
+    ],
+)
+def test_convert_extended_json_scalar_fast_path(value):
+    """
+    Verify the dispatch table for Extended JSON scalars yields the same results as the generic decoder.
+    """
+    converter = MongoDBCrateDBConverter()
+    fast = converter.decode_value(value)
+    with mock.patch.dict(EXTENDED_JSON_SCALAR_DECODERS, clear=True):
+        generic = converter.decode_value(value)
+    assert fast == generic
+    assert type(fast) is type(generic)
 
 
 def test_convert_basic():
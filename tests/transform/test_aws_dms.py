@@ -4,9 +4,10 @@ import json
 
 import pytest
 
-from commons_codec.exception import MessageFormatError, UnknownOperationError
-from commons_codec.model import ColumnType, ColumnTypeMapStore, SQLOperation, TableAddress
-from commons_codec.transform.aws_dms import DMSTranslatorCrateDB
+from commons_codec.exception import ErrorCode, MessageFormatError, UnknownOperationError
+from commons_codec.model import ColumnType, ColumnTypeMapStore, PrimaryKeyStore, SQLOperation, TableAddress
+from commons_codec.transform.aws_dms import DMSTranslatorCrateDB, DMSTranslatorCrateDBRecord
+from tests.conftest import assert_exc_msg
 
 RECORD_INSERT = {"age": 31, "attributes": {"baz": "qux"}, "id": 46, "name": "Jane"}
 RECORD_UPDATE = {"age": 33, "attributes": {"foo": "bar"}, "id": 42, "name": "John"}
@@ -175,10 +176,10 @@ MSG_CONTROL_AWSDMS = {
 }
 
 
-@pytest.fixture
-def cdc():
+@pytest.fixture(scope="module")
+def cdc_module():
     """
-    Provide fresh translator instance.
+    Provide translator instance, shared across the test module.
     """
     column_types = ColumnTypeMapStore().add(
         table=TableAddress(schema="public", table="foo"),
@@ -188,22 +189,83 @@ def cdc():
     return DMSTranslatorCrateDB(column_types=column_types)
 
 
-def test_decode_cdc_unknown_source(cdc):
-    with pytest.raises(MessageFormatError) as ex:
-        cdc.to_sql(MSG_UNKNOWN_SHAPE)
-    assert ex.match("Record not in DMS format: metadata and/or operation is missing")
+@pytest.fixture
+def cdc(cdc_module):
+    """
+    Provide translator instance with a clean schema cache.
+    """
+    cdc_module.clear_cache()
+    return cdc_module
 
 
-def test_decode_cdc_missing_schema_or_table(cdc):
-    with pytest.raises(MessageFormatError) as ex:
-        cdc.to_sql(MSG_SCHEMA_TABLE_MISSING)
-    assert ex.match("Schema or table name missing or empty: schema=None, table=None")
+@pytest.fixture(scope="module")
+def cdc_seeded():
+    """
+    Provide translator instance, seeded with a control message describing the table schema.
+    """
+    column_types = ColumnTypeMapStore().add(
+        table=TableAddress(schema="public", table="foo"),
+        column="attributes",
+        type_=ColumnType.MAP,
+    )
+    translator = DMSTranslatorCrateDB(column_types=column_types)
+    translator.to_sql(MSG_CONTROL_CREATE_TABLE)
+    return translator
+
+
+@pytest.mark.parametrize(
+    "message, error, code, text",
+    [
+        pytest.param(
+            MSG_UNKNOWN_SHAPE,
+            MessageFormatError,
+            ErrorCode.DMS_SHAPE,
+            "Record not in DMS format: metadata and/or operation is missing",
+            id="unknown-source",
+        ),
+        pytest.param(
+            MSG_SCHEMA_TABLE_MISSING,
+            MessageFormatError,
+            ErrorCode.DMS_ADDRESS,
+            "Schema or table name missing or empty: schema=None, table=None",
+            id="missing-schema-or-table",
+        ),
+        pytest.param(
+            MSG_UNKNOWN_OPERATION,
+            UnknownOperationError,
+            ErrorCode.UNKNOWN_OPERATION,
+            "Unknown CDC event operation: FOOBAR",
+            id="unknown-event",
+        ),
+        # Update and delete statements without schema knowledge are not possible.
+        # When no `create-table` statement has been processed yet,
+        # the machinery doesn't know about primary keys.
+        pytest.param(
+            MSG_DATA_UPDATE_VALUE,
+            ValueError,
+            None,
+            "Unable to invoke DML operation without primary key information",
+            id="update-without-pk",
+        ),
+        pytest.param(
+            MSG_DATA_DELETE,
+            ValueError,
+            None,
+            "Unable to invoke DML operation without primary key information",
+            id="delete-without-pk",
+        ),
+    ],
+)
+def test_decode_cdc_failure(cdc, message, error, code, text):
+    with pytest.raises(error) as ex:
+        cdc.to_sql(message)
+    assert getattr(ex.value, "code", None) is code
+    assert_exc_msg(ex, text)
 
 
 def test_decode_cdc_unknown_event(cdc):
     with pytest.raises(UnknownOperationError) as ex:
         cdc.to_sql(MSG_UNKNOWN_OPERATION)
-    assert ex.match("Unknown CDC event operation: FOOBAR")
     assert ex.value.operation == "FOOBAR"
     assert ex.value.record == {
         "control": {},
@@ -217,27 +279,115 @@ def test_decode_cdc_sql_ddl_regular(cdc):
     )
 
 
+def test_decode_cdc_sql_ddl_compile_state_once(cdc, mocker):
+    """
+    Processing a `create-table` control message compiles the table state only once.
+    """
+    compile_state = mocker.spy(DMSTranslatorCrateDBRecord, "compile_state")
+    cdc.to_sql(MSG_CONTROL_CREATE_TABLE)
+    assert compile_state.call_count == 1
+
+
+def test_decode_cdc_sql_ddl_recreate(cdc):
+    """
+    Processing a `create-table` control message again replaces the primary key information.
+    """
+    cdc.to_sql(MSG_CONTROL_CREATE_TABLE)
+    cdc.to_sql(MSG_CONTROL_CREATE_TABLE)
+    assert cdc.to_sql(MSG_DATA_DELETE).statement == "DELETE FROM public.foo WHERE data['id']=:id;"
+
+    msg_recreate = {
+        **MSG_CONTROL_CREATE_TABLE,
+        "control": {"table-def": {**MSG_CONTROL_CREATE_TABLE["control"]["table-def"], "primary-key": ["name"]}},
+    }
+    cdc.to_sql(msg_recreate)
+    assert cdc.to_sql(MSG_DATA_DELETE) == SQLOperation(
+        statement="DELETE FROM public.foo WHERE data['name']=:name;", parameters={"name": None}
+    )
+
+
 def test_decode_cdc_sql_ddl_awsdms(cdc):
     assert cdc.to_sql(MSG_CONTROL_AWSDMS) == SQLOperation(
         statement="CREATE TABLE IF NOT EXISTS dms.awsdms_apply_exceptions (data OBJECT(DYNAMIC));", parameters=None
     )
 
 
+def test_decode_cdc_schema_rewrites():
+    cdc = DMSTranslatorCrateDB(schema_rewrites={("public", "foo"): "sink"})
+    assert cdc.to_sql(MSG_CONTROL_CREATE_TABLE) == SQLOperation(
+        statement="CREATE TABLE IF NOT EXISTS sink.foo (data OBJECT(DYNAMIC));", parameters=None
+    )
+    assert cdc.to_sql(MSG_CONTROL_AWSDMS) == SQLOperation(
+        statement="CREATE TABLE IF NOT EXISTS dms.awsdms_apply_exceptions (data OBJECT(DYNAMIC));", parameters=None
+    )
+    # The configuration is only read, and never amended.
+    assert cdc.schema_rewrites == {("public", "foo"): "sink"}
+
+
 def test_decode_cdc_insert(cdc):
     assert cdc.to_sql(MSG_DATA_INSERT) == SQLOperation(
         statement="INSERT INTO public.foo (data) VALUES (:record);", parameters={"record": RECORD_INSERT}
     )
+    # The input event is not modified.
+    assert MSG_DATA_INSERT["data"]["attributes"] == '{"baz": "qux"}'
 
 
-def test_decode_cdc_update_success(cdc):
+def test_decode_cdc_insert_many(cdc):
     """
-    Update statements need schema knowledge about primary keys.
+    Consecutive events of the same shape are converged into a single batch operation.
+    """
+    operations = cdc.to_sql_many([MSG_DATA_INSERT] * 1000)
+    assert len(operations) == 1
+    assert operations[0].statement == "INSERT INTO public.foo (data) VALUES (:record);"
+    assert operations[0].parameters == [{"record": RECORD_INSERT}] * 1000
+
+
+def test_decode_cdc_mixed_many(cdc):
+    """
+    Events of different shapes are not converged, and their order is retained.
+    """
+    operations = cdc.to_sql_many(
+        [
+            MSG_CONTROL_CREATE_TABLE,
+            MSG_DATA_INSERT,
+            MSG_DATA_INSERT,
+            MSG_DATA_DELETE,
+            MSG_DATA_INSERT,
+        ]
+    )
+    assert operations == [
+        SQLOperation(statement="CREATE TABLE IF NOT EXISTS public.foo (data OBJECT(DYNAMIC));", parameters=None),
+        SQLOperation(
+            statement="INSERT INTO public.foo (data) VALUES (:record);",
+            parameters=[{"record": RECORD_INSERT}, {"record": RECORD_INSERT}],
+        ),
+        SQLOperation(statement="DELETE FROM public.foo WHERE data['id']=:id;", parameters=[{"id": 45}]),
+        SQLOperation(
+            statement="INSERT INTO public.foo (data) VALUES (:record);", parameters=[{"record": RECORD_INSERT}]
+        ),
+    ]
+
+
+def test_decode_cdc_statements_precomputed(cdc):
+    """
+    Processing a `create-table` control message precomputes the DML statements of the table.
     """
-    # Seed translator with control message, describing the table schema.
     cdc.to_sql(MSG_CONTROL_CREATE_TABLE)
+    state = cdc.table_state[TableAddress(schema="public", table="foo")]
+    assert state.insert_sql == "INSERT INTO public.foo (data) VALUES (:record);"
+    assert state.delete_sql == "DELETE FROM public.foo WHERE data['id']=:id;"
+    assert state.update_sql == {
+        frozenset(["age", "attributes", "id", "name"]): "UPDATE public.foo "
+        "SET data['age']=:age, data['attributes']=:attributes, data['name']=:name WHERE data['id']=:id;"
+    }
 
+
+def test_decode_cdc_update_success(cdc_seeded):
+    """
+    Update statements need schema knowledge about primary keys.
+    """
     # Emulate an UPDATE operation.
-    assert cdc.to_sql(MSG_DATA_UPDATE_VALUE) == SQLOperation(
+    assert cdc_seeded.to_sql(MSG_DATA_UPDATE_VALUE) == SQLOperation(
         statement="UPDATE public.foo SET "
         "data['age']=:age, data['attributes']=:attributes, data['name']=:name "
         "WHERE data['id']=:id;",
@@ -245,43 +395,111 @@ def test_decode_cdc_update_success(cdc):
     )
 
 
-def test_decode_cdc_update_failure():
+def test_decode_cdc_update_parameters_not_shared(cdc):
+    """
+    Update parameters do not share their dictionary with the record data of the event.
     """
-    Update statements without schema knowledge are not possible.
+    cdc.to_sql(MSG_CONTROL_CREATE_TABLE)
+    data = {"name": "John", "id": 42}
+    operation = cdc.to_sql({"data": data, "metadata": MSG_DATA_UPDATE_VALUE["metadata"]})
+    assert operation.parameters == data
+    assert operation.parameters is not data
+    operation.parameters["name"] = "Jane"
+    assert data == {"name": "John", "id": 42}
+
 
-    When no `create-table` statement has been processed yet,
-    the machinery doesn't know about primary keys.
+def test_decode_cdc_update_without_pk_value(cdc_seeded):
     """
-    # Emulate an UPDATE operation without seeding the translator.
-    with pytest.raises(ValueError) as ex:
-        DMSTranslatorCrateDB().to_sql(MSG_DATA_UPDATE_VALUE)
-    assert ex.match("Unable to invoke DML operation without primary key information")
+    Update statements bind `NULL` for primary key values missing from the record.
+    """
+    message = {"data": {"name": "John"}, "metadata": MSG_DATA_UPDATE_VALUE["metadata"]}
+    assert cdc_seeded.to_sql(message) == SQLOperation(
+        statement="UPDATE public.foo SET data['name']=:name WHERE data['id']=:id;",
+        parameters={"name": "John", "id": None},
+    )
 
 
-def test_decode_cdc_delete_success(cdc):
+def test_decode_cdc_update_column_order(cdc):
     """
-    Delete statements need schema knowledge about primary keys.
+    Update statements are cached by column set, independently of the order of columns within the record.
     """
-    # Seed translator with control message, describing the table schema.
     cdc.to_sql(MSG_CONTROL_CREATE_TABLE)
+    metadata = MSG_DATA_UPDATE_VALUE["metadata"]
+    operation1 = cdc.to_sql({"data": {"name": "John", "id": 42, "age": 33}, "metadata": metadata})
+    operation2 = cdc.to_sql({"data": {"age": 33, "name": "John", "id": 42}, "metadata": metadata})
+    assert operation1.statement == "UPDATE public.foo SET data['age']=:age, data['name']=:name WHERE data['id']=:id;"
+    assert operation1 == operation2
+    assert len(cdc.table_state[TableAddress(schema="public", table="foo")].update_sql) == 2
 
-    # Emulate a DELETE operation.
+
+def test_decode_cdc_clear_cache(cdc):
+    cdc.to_sql(MSG_CONTROL_CREATE_TABLE)
+    cdc.clear_cache()
+    assert cdc.primary_keys == {}
+    assert cdc.table_state == {}
+    assert cdc.column_types[TableAddress(schema="public", table="foo")] == {"attributes": ColumnType.MAP}
+
+
+def test_decode_cdc_clear_cache_retains_configured_primary_keys():
+    """
+    Clearing the cache restores primary keys configured upfront, instead of forgetting them.
+    """
+    address = TableAddress(schema="public", table="foo")
+    cdc = DMSTranslatorCrateDB(primary_keys=PrimaryKeyStore({address: ["id"]}))
+    cdc.to_sql(
+        {
+            **MSG_CONTROL_CREATE_TABLE,
+            "control": {"table-def": {**MSG_CONTROL_CREATE_TABLE["control"]["table-def"], "primary-key": ["name"]}},
+        }
+    )
+    assert cdc.primary_keys == {address: ["name"]}
+    cdc.clear_cache()
+    assert cdc.primary_keys == {address: ["id"]}
+    assert cdc.table_state == {}
     assert cdc.to_sql(MSG_DATA_DELETE) == SQLOperation(
         statement="DELETE FROM public.foo WHERE data['id']=:id;", parameters={"id": 45}
     )
 
 
-def test_decode_cdc_delete_failure(cdc):
+def test_decode_cdc_delete_success(cdc_seeded):
     """
-    Delete statements without schema knowledge are not possible.
+    Delete statements need schema knowledge about primary keys.
+    """
+    # Emulate a DELETE operation.
+    assert cdc_seeded.to_sql(MSG_DATA_DELETE) == SQLOperation(
+        statement="DELETE FROM public.foo WHERE data['id']=:id;", parameters={"id": 45}
+    )
+
 
-    When no `create-table` statement has been processed yet,
-    the machinery doesn't know about primary keys.
+def test_decode_cdc_positional_binding():
     """
-    # Emulate an DELETE operation without seeding the translator.
+    Positional binding renders `?` placeholders, and emits parameters as tuples.
+    """
+    column_types = ColumnTypeMapStore().add(
+        table=TableAddress(schema="public", table="foo"),
+        column="attributes",
+        type_=ColumnType.MAP,
+    )
+    cdc = DMSTranslatorCrateDB(column_types=column_types, binding_style="positional")
+    cdc.to_sql(MSG_CONTROL_CREATE_TABLE)
+    assert cdc.to_sql(MSG_DATA_INSERT) == SQLOperation(
+        statement="INSERT INTO public.foo (data) VALUES (?);",
+        parameters=(RECORD_INSERT,),
+    )
+    assert cdc.to_sql(MSG_DATA_UPDATE_VALUE) == SQLOperation(
+        statement="UPDATE public.foo SET data['age']=?, data['attributes']=?, data['name']=? WHERE data['id']=?;",
+        parameters=(33, {"foo": "bar"}, "John", 42),
+    )
+    assert cdc.to_sql(MSG_DATA_DELETE) == SQLOperation(
+        statement="DELETE FROM public.foo WHERE data['id']=?;",
+        parameters=(45,),
+    )
+
+
+def test_decode_cdc_binding_style_unknown():
     with pytest.raises(ValueError) as ex:
-        DMSTranslatorCrateDB().to_sql(MSG_DATA_DELETE)
-    assert ex.match("Unable to invoke DML operation without primary key information")
+        DMSTranslatorCrateDB(binding_style="foo")
+    assert_exc_msg(ex, "Unknown binding style: foo")
 
 
 if __name__ == "__main__":
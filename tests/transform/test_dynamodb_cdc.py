@@ -1,10 +1,10 @@
-from collections import Counter
 from decimal import Decimal
 
 import pytest
 
 from commons_codec.model import SQLOperation, UniversalRecord
-from commons_codec.transform.dynamodb import CrateDBTypeDeserializer, DynamoDBCDCTranslator, DynamoDBFullLoadTranslator
+from commons_codec.transform.dynamodb import DynamoDBCDCTranslator, DynamoDBFullLoadTranslator
+from tests.conftest import assert_exc_msg
 
 pytestmark = pytest.mark.dynamodb
 
@@ -18,12 +18,25 @@ MSG_UNKNOWN_EVENT = {
     "eventName": "FOOBAR",
 }
 
-MSG_INSERT_BASIC = {
+# Attributes common to all DynamoDB CDC event messages.
+MSG_BASE = {
     "awsRegion": "us-east-1",
-    "eventID": "b015b5f0-c095-4b50-8ad0-4279aa3d88c6",
-    "eventName": "INSERT",
     "userIdentity": None,
     "recordFormat": "application/json",
+    "eventSource": "aws:dynamodb",
+}
+
+# Set-typed attributes shared by most of the record images.
+IMAGE_SETS = {
+    "string_set": {"SS": ["location_1"]},
+    "number_set": {"NS": [1, 2, 3, 0.34]},
+    "binary_set": {"BS": ["U3Vubnk="]},
+}
+
+MSG_INSERT_BASIC = {
+    **MSG_BASE,
+    "eventID": "b015b5f0-c095-4b50-8ad0-4279aa3d88c6",
+    "eventName": "INSERT",
     "tableName": "foo",
     "dynamodb": {
         "ApproximateCreationDateTime": 1720740233012995,
@@ -41,14 +54,11 @@ MSG_INSERT_BASIC = {
         "SizeBytes": 99,
         "ApproximateCreationDateTimePrecision": "MICROSECOND",
     },
-    "eventSource": "aws:dynamodb",
 }
 MSG_INSERT_NESTED = {
-    "awsRegion": "us-east-1",
+    **MSG_BASE,
     "eventID": "b581c2dc-9d97-44ed-94f7-cb77e4fdb740",
     "eventName": "INSERT",
-    "userIdentity": None,
-    "recordFormat": "application/json",
     "tableName": "table-testdrive-nested",
     "dynamodb": {
         "ApproximateCreationDateTime": 1720800199717446,
@@ -57,9 +67,7 @@ MSG_INSERT_NESTED = {
             "id": {"S": "5F9E-Fsadd41C-4C92-A8C1-70BF3FFB9266"},
             "data": {"M": {"temperature": {"N": "42.42"}, "humidity": {"N": "84.84"}}},
             "meta": {"M": {"timestamp": {"S": "2024-07-12T01:17:42"}, "device": {"S": "foo"}}},
-            "string_set": {"SS": ["location_1"]},
-            "number_set": {"NS": [1, 2, 3, 0.34]},
-            "binary_set": {"BS": ["U3Vubnk="]},
+            **IMAGE_SETS,
             "somemap": {
                 "M": {
                     "test": {"N": 1},
@@ -70,14 +78,11 @@ MSG_INSERT_NESTED = {
         "SizeBytes": 156,
         "ApproximateCreationDateTimePrecision": "MICROSECOND",
     },
-    "eventSource": "aws:dynamodb",
 }
 MSG_MODIFY_BASIC = {
-    "awsRegion": "us-east-1",
+    **MSG_BASE,
     "eventID": "24757579-ebfd-480a-956d-a1287d2ef707",
     "eventName": "MODIFY",
-    "userIdentity": None,
-    "recordFormat": "application/json",
     "tableName": "foo",
     "dynamodb": {
         "ApproximateCreationDateTime": 1720742302233719,
@@ -89,9 +94,7 @@ MSG_MODIFY_BASIC = {
             "device": {"S": "bar"},
             "location": {"S": "Sydney"},
             "timestamp": {"S": "2024-07-12T01:17:42"},
-            "string_set": {"SS": ["location_1"]},
-            "number_set": {"NS": [1, 2, 3, 0.34]},
-            "binary_set": {"BS": ["U3Vubnk="]},
+            **IMAGE_SETS,
             "empty_string": {"S": ""},
             "null_string": {"S": None},
         },
@@ -105,14 +108,11 @@ MSG_MODIFY_BASIC = {
         "SizeBytes": 161,
         "ApproximateCreationDateTimePrecision": "MICROSECOND",
     },
-    "eventSource": "aws:dynamodb",
 }
 MSG_MODIFY_NESTED = {
-    "awsRegion": "us-east-1",
+    **MSG_BASE,
     "eventID": "24757579-ebfd-480a-956d-a1287d2ef707",
     "eventName": "MODIFY",
-    "userIdentity": None,
-    "recordFormat": "application/json",
     "tableName": "foo",
     "dynamodb": {
         "ApproximateCreationDateTime": 1720742302233719,
@@ -124,9 +124,7 @@ MSG_MODIFY_NESTED = {
             "empty_map": {"M": {}},
             "empty_list": {"L": []},
             "timestamp": {"S": "2024-07-12T01:17:42"},
-            "string_set": {"SS": ["location_1"]},
-            "number_set": {"NS": [1, 2, 3, 0.34]},
-            "binary_set": {"BS": ["U3Vubnk="]},
+            **IMAGE_SETS,
             "somemap": {
                 "M": {
                     "test": {"N": 1},
@@ -145,14 +143,11 @@ MSG_MODIFY_NESTED = {
         "SizeBytes": 161,
         "ApproximateCreationDateTimePrecision": "MICROSECOND",
     },
-    "eventSource": "aws:dynamodb",
 }
 MSG_REMOVE = {
-    "awsRegion": "us-east-1",
+    **MSG_BASE,
     "eventID": "ff4e68ab-0820-4a0c-80b2-38753e8e00e5",
     "eventName": "REMOVE",
-    "userIdentity": None,
-    "recordFormat": "application/json",
     "tableName": "foo",
     "dynamodb": {
         "ApproximateCreationDateTime": 1720742321848352,
@@ -163,9 +158,7 @@ MSG_REMOVE = {
             "temperature": {"N": "55.66"},
             "device": {"S": "bar"},
             "timestamp": {"S": "2024-07-12T01:17:42"},
-            "string_set": {"SS": ["location_1"]},
-            "number_set": {"NS": [1, 2, 3, 0.34]},
-            "binary_set": {"BS": ["U3Vubnk="]},
+            **IMAGE_SETS,
             "somemap": {
                 "M": {
                     "test": {"N": 1},
@@ -176,7 +169,6 @@ MSG_REMOVE = {
         "SizeBytes": 99,
         "ApproximateCreationDateTimePrecision": "MICROSECOND",
     },
-    "eventSource": "aws:dynamodb",
 }
 
 
@@ -189,13 +181,13 @@ def test_decode_ddb_deserialize_type(dynamodb_cdc_translator_foo):
 def test_decode_cdc_unknown_source(dynamodb_cdc_translator_foo):
     with pytest.raises(ValueError) as ex:
         dynamodb_cdc_translator_foo.to_sql(MSG_UNKNOWN_SOURCE)
-    assert ex.match("Unknown eventSource: foo:bar")
+    assert_exc_msg(ex, "Unknown eventSource: foo:bar")
 
 
 def test_decode_cdc_unknown_event(dynamodb_cdc_translator_foo):
     with pytest.raises(ValueError) as ex:
         dynamodb_cdc_translator_foo.to_sql(MSG_UNKNOWN_EVENT)
-    assert ex.match("Unknown CDC event name: FOOBAR")
+    assert_exc_msg(ex, "Unknown CDC event name: FOOBAR")
 
 
 def test_decode_cdc_insert_basic(dynamodb_cdc_translator_foo):
@@ -287,6 +279,17 @@ def test_decode_cdc_modify_nested(dynamodb_cdc_translator_foo):
     )
 
 
+def test_decode_cdc_modify_ignores_old_image(dynamodb_cdc_translator_foo):
+    """
+    The `OldImage` of MODIFY events is not deserialized, so its content does not matter.
+    """
+    event = {
+        **MSG_MODIFY_BASIC,
+        "dynamodb": {**MSG_MODIFY_BASIC["dynamodb"], "OldImage": {"device": {"UNKNOWN": "foo"}}},
+    }
+    assert dynamodb_cdc_translator_foo.to_sql(event) == dynamodb_cdc_translator_foo.to_sql(MSG_MODIFY_BASIC)
+
+
 def test_decode_cdc_remove(dynamodb_cdc_translator_foo):
     assert dynamodb_cdc_translator_foo.to_sql(MSG_REMOVE) == SQLOperation(
         statement="DELETE FROM foo WHERE pk=:pk;",
@@ -300,32 +303,49 @@ def test_decode_cdc_remove(dynamodb_cdc_translator_foo):
     )
 
 
-def test_deserialize_number_set():
-    deserializer = CrateDBTypeDeserializer()
+@pytest.mark.parametrize("message", [MSG_INSERT_BASIC, MSG_MODIFY_NESTED, MSG_REMOVE])
+def test_decode_event_matches_to_sql(dynamodb_cdc_translator_foo, message):
+    """
+    `decode_event` and `to_sql` decode CDC events the same way.
+    """
+    record = dynamodb_cdc_translator_foo.decode_event(message["dynamodb"])
+    assert record.to_dict() == dynamodb_cdc_translator_foo.to_sql(message).parameters
+
+
+def test_decode_cdc_many(dynamodb_cdc_translator_foo):
+    """
+    Consecutive events of the same type are converged into a single batch operation.
+    """
+    operations = dynamodb_cdc_translator_foo.to_sql_many(
+        [MSG_INSERT_BASIC, MSG_INSERT_BASIC, MSG_MODIFY_BASIC, MSG_REMOVE, MSG_REMOVE]
+    )
+    assert [operation.statement for operation in operations] == [
+        "INSERT INTO foo (pk, data, aux) VALUES (:pk, :typed, :untyped) ON CONFLICT DO NOTHING;",
+        "UPDATE foo SET data=:typed, aux=:untyped WHERE pk=:pk;",
+        "DELETE FROM foo WHERE pk=:pk;",
+    ]
+    assert [len(operation.parameters) for operation in operations] == [2, 1, 2]
+    assert operations[0].parameters[0] == dynamodb_cdc_translator_foo.to_sql(MSG_INSERT_BASIC).parameters
+
+
+def test_deserialize_number_set(deserializer):
     assert deserializer.deserialize({"NS": ["1", "1.25"]}) == [
         Decimal("1"),
         Decimal("1.25"),
     ]
 
 
-def test_deserialize_string_set():
-    deserializer = CrateDBTypeDeserializer()
-    # We us Counter because when the set is transformed into a list, it loses order.
-    assert Counter(deserializer.deserialize({"SS": ["foo", "bar"]})) == Counter(
-        [
-            "foo",
-            "bar",
-        ]
-    )
+def test_deserialize_string_set(deserializer):
+    # Compare sorted, because when the set is transformed into a list, it loses order.
+    # Unlike comparing as sets, this also catches duplicate elements.
+    assert sorted(deserializer.deserialize({"SS": ["foo", "bar", "foo"]})) == ["bar", "foo"]
 
 
-def test_deserialize_binary_set():
-    deserializer = CrateDBTypeDeserializer()
-    assert Counter(deserializer.deserialize({"BS": [b"\x00", b"\x01"]})) == Counter([b"\x00", b"\x01"])
+def test_deserialize_binary_set(deserializer):
+    assert sorted(deserializer.deserialize({"BS": [b"\x01", b"\x00", b"\x01"]})) == [b"\x00", b"\x01"]
 
 
-def test_deserialize_list_objects():
-    deserializer = CrateDBTypeDeserializer()
+def test_deserialize_list_objects(deserializer):
     assert deserializer.deserialize(
         {
             "L": [
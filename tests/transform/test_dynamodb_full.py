@@ -2,6 +2,8 @@ import pytest
 
 from commons_codec.model import SQLOperation
 from commons_codec.transform.dynamodb import DynamoDBFullLoadTranslator
+from commons_codec.transform.dynamodb_model import PrimaryKeySchema
+from tests.conftest import assert_exc_msg
 
 pytestmark = pytest.mark.dynamodb
 
@@ -86,11 +88,22 @@ def test_sql_ddl_success(dynamodb_full_translator_foo):
     )
 
 
+def test_sql_ddl_schema_changed():
+    """
+    The SQL DDL statement reflects changes to the primary key schema after first access.
+    """
+    schema = PrimaryKeySchema().add("id", "S")
+    translator = DynamoDBFullLoadTranslator(table_name="foo", primary_key_schema=schema)
+    assert '("id" STRING PRIMARY KEY)' in translator.sql_ddl
+    schema.add("ts", "N")
+    assert '("id" STRING PRIMARY KEY, "ts" BIGINT PRIMARY KEY)' in translator.sql_ddl
+
+
 def test_sql_ddl_failure(dynamodb_full_translator_foo):
     translator = DynamoDBFullLoadTranslator(table_name="foo")
     with pytest.raises(IOError) as ex:
         _ = translator.sql_ddl
-    assert ex.match("Unable to generate SQL DDL without key schema information")
+    assert_exc_msg(ex, "Unable to generate SQL DDL without key schema information")
 
 
 def test_to_sql_operation(dynamodb_full_translator_foo):
@@ -134,3 +147,15 @@ def test_to_sql_cratedb(caplog, cratedb, dynamodb_full_translator_foo):
     assert results[0]["pk"] == RECORD_OUT_PK
     assert results[0]["data"] == RECORD_OUT_DATA
     assert results[0]["aux"] == RECORD_OUT_AUX
+
+
+def test_decode_record_schema_changed():
+    """
+    Primary key columns reflect changes to the primary key schema after construction.
+    """
+    schema = PrimaryKeySchema().add("id", "S")
+    translator = DynamoDBFullLoadTranslator(table_name="foo", primary_key_schema=schema)
+    schema.add("ts", "N")
+    record = translator.decode_record({"id": {"S": "foo"}, "ts": {"N": "42"}, "name": {"S": "bar"}})
+    assert record.pk == {"id": "foo", "ts": 42.0}
+    assert record.typed == {"name": "bar"}
@@ -1,6 +1,7 @@
 import pytest
 
 from commons_codec.transform.dynamodb_model import PrimaryKeySchema
+from tests.conftest import assert_exc_msg
 
 
 def test_primary_key_schema_from_table_success():
@@ -28,4 +29,4 @@ def test_primary_key_schema_from_table_unknown_type():
 
     with pytest.raises(KeyError) as ex:
         PrimaryKeySchema.from_table(SurrogateTable())
-    assert ex.match("Mapping DynamoDB type failed: name=Id, type=F")
+    assert_exc_msg(ex, "Mapping DynamoDB type failed: name=Id, type=F")
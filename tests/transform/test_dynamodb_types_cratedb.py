@@ -1,3 +1,4 @@
+import sys
 import unittest
 from decimal import Decimal
 
@@ -5,6 +6,7 @@ import pytest
 
 from commons_codec.model import UniversalRecord
 from commons_codec.transform.dynamodb import CrateDBTypeDeserializer
+from tests.conftest import assert_exc_msg
 
 pytestmark = pytest.mark.dynamodb
 
@@ -25,3 +27,52 @@ def test_decode_typed_untyped(dynamodb_cdc_translator_foo):
     assert dynamodb_cdc_translator_foo.decode_record(
         {"foo": {"N": "84.84"}, "bar": {"L": [{"N": "1"}, {"S": "foo"}]}}
     ) == UniversalRecord(pk={}, typed={"foo": 84.84}, untyped={"bar": [1.0, "foo"]})
+
+
+def test_decode_parameters(dynamodb_cdc_translator_foo):
+    assert dynamodb_cdc_translator_foo.decode_parameters(
+        {"id": {"S": "foo"}, "bar": {"L": [{"N": "1"}, {"S": "foo"}]}}, key_names=["id"]
+    ) == {"pk": {"id": "foo"}, "typed": {}, "untyped": {"bar": [1.0, "foo"]}}
+
+
+def test_deserialize_unknown_type(deserializer):
+    with pytest.raises(TypeError) as ex:
+        deserializer.deserialize({"FOO": "bar"})
+    assert_exc_msg(ex, "Dynamodb type FOO is not supported")
+    with pytest.raises(TypeError) as ex:
+        deserializer.deserialize({})
+    assert_exc_msg(ex, "Value must be a nonempty dictionary whose key is a valid dynamodb type.")
+
+
+def test_deserialize_unknown_type_nested(deserializer):
+    with pytest.raises(TypeError) as ex:
+        deserializer.deserialize({"L": [{"S": "foo"}, {"FOO": "bar"}]})
+    assert_exc_msg(ex, "Dynamodb type FOO is not supported")
+    with pytest.raises(TypeError) as ex:
+        deserializer.deserialize({"M": {"foo": {}}})
+    assert_exc_msg(ex, "Value must be a nonempty dictionary whose key is a valid dynamodb type.")
+
+
+def test_deserialize_number(deserializer):
+    assert deserializer.deserialize({"N": "84.84"}) == 84.84
+    assert deserializer.deserialize({"N": "-1e-130"}) == -1e-130
+    assert deserializer.deserialize({"N": "12345678901234567890123456789012345678"}) == 1.2345678901234568e37
+    assert isinstance(deserializer.deserialize({"N": 42}), float)
+
+
+def test_deserialize_number_set_sorted(deserializer):
+    assert deserializer.deserialize({"NS": ["3", "0.34", "1", "2"]}) == [0.34, 1.0, 2.0, 3.0]
+
+
+def test_deserialize_empty_containers(deserializer):
+    empty_list = deserializer.deserialize({"L": []})
+    assert empty_list == []
+    assert empty_list.get_tag("varied", None) is False
+    assert empty_list is not deserializer.deserialize({"L": []})
+    assert deserializer.deserialize({"M": {}}) == {}
+
+
+def test_decode_record_interned_keys(dynamodb_cdc_translator_foo):
+    name = "".join(["tempera", "ture"])
+    record = dynamodb_cdc_translator_foo.decode_record({name: {"N": "42.42"}})
+    assert next(iter(record.typed)) is sys.intern("temperature")
@@ -20,6 +20,13 @@ def test_is_number_numeric():
     assert is_number("1١¼Ⅱ¼")
 
 
+def test_is_number_empty_string():
+    """
+    The empty string is not a number.
+    """
+    assert is_number("") is False
+
+
 def test_is_number_non_numeric():
     assert not is_number("abc")
     assert not is_number("🌻")
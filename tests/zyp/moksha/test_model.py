@@ -50,6 +50,23 @@ def test_moksha_transformation_success_jq():
     assert moksha.apply(4242) == 42.42
 
 
+def test_moksha_transformation_chain_jq_comment():
+    """
+    A trailing comment in a jq rule does not affect subsequent rules.
+    """
+    moksha = MokshaTransformation().jq(". /= 100  # scale down").jq(". * 2")
+    assert moksha.apply(4242) == 84.84
+
+
+def test_moksha_transformation_chain_jq_first_output():
+    """
+    Each jq rule is evaluated on its own, passing on only its first output.
+    """
+    moksha = MokshaTransformation().jq(".[]").jq("select(. > 1)")
+    with pytest.raises(StopIteration):
+        moksha.apply([1, 2, 3])
+
+
 def test_moksha_transformation_error_jq_scalar(caplog):
     logging.getLogger("zyp.model.moksha").setLevel(logging.DEBUG)
     moksha = MokshaTransformation().jq(". /= 100")
@@ -201,6 +201,42 @@ def test_value_converter_unknown_function_disabled():
     ValueConverter().add(pointer="/foo", transformer="unknown42", disabled=True)
 
 
+def test_field_renamer_success():
+    """
+    Renaming fields retains their order.
+    """
+    renamer = FieldRenamer().add(old="_id", new="id").add(old="ts", new="timestamp")
+    result = renamer.apply({"_id": 42, "value": 42.42, "ts": 123})
+    assert list(result.items()) == [("id", 42), ("value", 42.42), ("timestamp", 123)]
+
+
+def test_field_renamer_chained():
+    """
+    Renaming fields sequentially, where one rule picks up the outcome of another.
+    """
+    renamer = FieldRenamer().add(old="a", new="b").add(old="b", new="c")
+    assert dict(renamer.apply({"a": 1, "x": 2})) == {"c": 1, "x": 2}
+
+
+def test_field_renamer_missing():
+    renamer = FieldRenamer().add(old="_id", new="id")
+    with pytest.raises(KeyError) as ex:
+        renamer.apply({"value": 42.42})
+    assert ex.match("Cannot rename key _id to id: _id not existing in dict")
+
+
+def test_field_renamer_conflict():
+    renamer = FieldRenamer().add(old="_id", new="id")
+    with pytest.raises(KeyError) as ex:
+        renamer.apply({"_id": 42, "id": 43})
+    assert ex.match("Cannot rename key _id to id: id already in dict")
+
+    renamer = FieldRenamer().add(old="a", new="c").add(old="b", new="c")
+    with pytest.raises(KeyError) as ex:
+        renamer.apply({"a": 1, "b": 2})
+    assert ex.match("Cannot rename key b to c: c already in dict")
+
+
 def test_bucket_transformation_success():
     """
     Converting values with a complete transformation description.
@@ -250,6 +286,17 @@ def test_bucket_transformation_idempotency():
     assert result == BasicReading.ingress
 
 
+def test_bucket_transformation_empty_engines():
+    """
+    Running a transformation with empty sub-engines returns the original input value as-is.
+    """
+    transformation = BucketTransformation(
+        names=FieldRenamer(), values=ValueConverter(), transon=TransonTransformation()
+    )
+    data = deepcopy(BasicReading.ingress)
+    assert transformation.apply(data) is data
+
+
 def test_bucket_marshal_success():
     """
     A transformation description can be serialized to a data structure and back.
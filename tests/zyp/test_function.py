@@ -1,7 +1,7 @@
 import datetime as dt
 
 import pytest
-from dateutil.parser import ParserError
+from dateutil.parser import ParserError, parse
 
 from zyp.function import to_datetime, to_unixtime
 
@@ -16,6 +16,30 @@ def test_to_datetime_success():
     assert to_datetime(None) is None
 
 
+@pytest.mark.parametrize(
+    "value",
+    [
+        "06/30/2023",
+        "6/5/2023",
+        "13/01/2024",
+        "2023-06-30",
+        "2023-06-30T12:34:56",
+        "2023-06-30 12:34:56.123456",
+        "2023-06-30T12:34:56+02:00",
+        "2023-06-30T12:34:56Z",
+        "20230630",
+    ],
+)
+def test_to_datetime_parity(value):
+    """
+    Fast-path parsing yields the same results as `dateutil`, including its time zone objects.
+    """
+    result = to_datetime(value)
+    reference = parse(value)
+    assert result == reference
+    assert type(result.tzinfo) is type(reference.tzinfo)
+
+
 def test_to_datetime_failure():
     with pytest.raises(ParserError) as ex:
         to_datetime("---", on_error="raise")
@@ -17,3 +17,31 @@ def test_swap_node_not_found_ignore():
     pointer = JsonPointer("/foo")
     new_data = swap_node(pointer, data, on_error="ignore")
     assert new_data is data
+
+
+def test_swap_node_dict_nested():
+    data = {"meta": {"date": "foo"}}
+    new_data = swap_node(JsonPointer("/meta/date"), data, str.upper)
+    assert new_data is data
+    assert data == {"meta": {"date": "FOO"}}
+
+
+def test_swap_node_sequence():
+    data = {"items": [{"value": 1}, {"value": 2}]}
+    swap_node(JsonPointer("/items/1/value"), data, lambda x: x * 10)
+    assert data == {"items": [{"value": 1}, {"value": 20}]}
+    swap_node(JsonPointer("/items/0"), data, lambda x: x["value"])
+    assert data == {"items": [1, {"value": 20}]}
+
+
+def test_swap_node_sequence_invalid():
+    data = {"items": [1, 2], "text": "foo"}
+    for pointer in ["/items/2", "/items/01", "/items/foo", "/text/0", "/items/0/foo"]:
+        with pytest.raises(JsonPointerException) as ex:
+            swap_node(JsonPointer(pointer), data, on_error="raise")
+        assert ex.match(f"Element not found: {pointer}")
+    assert data == {"items": [1, 2], "text": "foo"}
+
+
+def test_swap_node_root():
+    assert swap_node(JsonPointer(""), {"foo": "bar"}, lambda x: x["foo"]) == "bar"
@@ -1,3 +1,7 @@
+import sys
+
+import pytest
+
 from zyp.model.treatment import Treatment
 
 RECORD_IN = {
@@ -44,6 +48,65 @@ def test_treatment_noop():
     assert transformation.apply([{"data": {"abc": 123}}]) == [{"data": {"abc": 123}}]
 
 
+def test_treatment_noop_skips_traversal(mocker):
+    """
+    Treating data without rules does not traverse it.
+    """
+    transformation = Treatment()
+    apply_record = mocker.patch.object(Treatment, "apply_record")
+    data = [{"data": {"abc": 123}}]
+    assert transformation.apply(data) is data
+    apply_record.assert_not_called()
+
+
+def test_treatment_rules_added_after_construction():
+    """
+    Rules added after constructing a treatment are respected.
+    """
+    transformation = Treatment()
+    transformation.ignore_field.append("abc")
+    assert transformation.apply({"abc": 123}) == {}
+
+
+def test_treatment_conversions_changed_after_construction():
+    """
+    Changes to conversion rules after constructing a treatment are respected.
+    """
+    transformation = Treatment(convert_string=["abc"])
+    transformation.convert_list.append("def")
+    transformation.convert_dict = [{"name": "ghi", "wrapper_name": "id"}]
+    assert transformation.apply({"abc": 123, "def": 456, "ghi": 789}) == {
+        "abc": "123",
+        "def": [456],
+        "ghi": {"id": 789},
+    }
+
+
+def test_treatment_from_dict_unknown_argument():
+    """
+    Treatments do not accept internal state as constructor arguments.
+    """
+    with pytest.raises(TypeError):
+        Treatment.from_dict({"convert_string": ["abc"], "noop": True})
+    with pytest.raises(TypeError):
+        Treatment.from_dict({"convert_string": ["abc"], "conversions": []})
+
+
+def test_treatment_deeply_nested():
+    """
+    Treating deeply nested data is not limited by the interpreter's recursion limit.
+    """
+    data: dict = {"ignore_field": 123}
+    for _ in range(sys.getrecursionlimit() + 1):
+        data = {"data": [data]}
+    transformation = Treatment(ignore_field=["ignore_field"])
+    result = transformation.apply(data)
+    assert result is data
+    for _ in range(sys.getrecursionlimit() + 1):
+        data = data["data"][0]
+    assert data == {}
+
+
 def test_treatment_ignore_complex_lists_basic():
     """
     Verify the "ignore_complex_lists" directive works.
@@ -124,3 +187,11 @@ def test_treatment_prune_invalid_date():
     transformation = Treatment(prune_invalid_date=["date"])
     assert transformation.apply([{"data": [{"date": 123}]}]) == [{"data": [{}]}]
     assert transformation.apply([{"data": [{"date": {"date": 123}}]}]) == [{"data": [{"date": {}}]}]
+
+
+def test_treatment_serialize_roundtrip():
+    """
+    Verify precompiled conversion rules do not impair comparing treatments.
+    """
+    transformation = Treatment(convert_dict=[{"name": "abc", "wrapper_name": "id"}], convert_list=["def"])
+    assert Treatment.from_yaml(transformation.to_yaml()) == transformation
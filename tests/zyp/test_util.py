@@ -13,6 +13,18 @@ def test_to_pointer_string():
     assert to_pointer("") == jsonpointer.JsonPointer("")
 
 
+def test_to_pointer_string_independent():
+    pointer = to_pointer("/a")
+    pointer.parts.append("b")
+    assert to_pointer("/a").parts == ["a"]
+
+
+def test_to_pointer_string_invalid():
+    with pytest.raises(ValueError) as ex:
+        to_pointer("a")
+    assert ex.match("Location must start with /")
+
+
 def test_to_pointer_jsonpointer():
     assert to_pointer(jsonpointer.JsonPointer("/")) == jsonpointer.JsonPointer("/")
 
@@ -40,6 +52,10 @@ def test_compile_expression_jq():
     assert transformer.program_string.endswith(".")
 
 
+def test_compile_expression_jq_cached():
+    assert compile_expression(type="jq", expression=".foo") is compile_expression(type="jq", expression=".foo")
+
+
 def test_compile_expression_transon():
     transformer: transon.Transformer = compile_expression(type="transon", expression={"$": "this"})
     assert transformer.template == {"$": "this"}